@@ -12,6 +12,8 @@ Usage:
 
 Requirements:
     Python 3.10+ (no external dependencies)
+    lxml and orjson (optional) are used for faster RSS parsing and JSON output
+    when installed
 
 Note: The MathWorks blog uses Akamai CDN with bot protection. This script works
 best when run from GitHub Actions or similar CI environments. If you get 403
@@ -19,24 +21,46 @@ errors locally, try running from a different network or use the --use-cache flag
 """
 
 import argparse
+import codecs
+import hashlib
+import html
+import io
 import json
 import os
 import re
 import subprocess
 import sys
-import xml.etree.ElementTree as ET
-from datetime import datetime
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.client import HTTPException
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Configuration
 AUTHOR_NAME = "Yann Debray"
 START_DATE = datetime(2025, 9, 1)  # September 1st, 2025
 OUTPUT_FILE = Path(__file__).parent / "posts.json"
-CACHE_FILE = Path(__file__).parent / ".rss_cache.xml"
+RSS_CACHE_DIR = Path(__file__).parent / ".rss_cache"
+RSS_CACHE_INDEX = RSS_CACHE_DIR / "index.json"
 
 # RSS feed URLs to check
 RSS_FEEDS = [
@@ -46,6 +70,9 @@ RSS_FEEDS = [
     "https://blogs.mathworks.com/deep-learning/feed/?paged=3",
 ]
 
+# Maximum number of blog post pages fetched at the same time
+MAX_CONCURRENT_REQUESTS = 8
+
 # Request headers matching the working MikeVsYann approach
 HEADERS = {
     "User-Agent": (
@@ -59,176 +86,390 @@ HEADERS = {
     "Referer": "https://blogs.mathworks.com/",
 }
 
+# Text of the Akamai block page returned instead of blocked content
+CDN_BLOCK_MARKER = b"Access Denied"
+
 # Regex to extract view count from blog post HTML
 VIEW_REGEX = re.compile(r'class="icon-watch icon_16"></span>\s*([0-9,]+)\s+views', re.IGNORECASE)
 
+# Regexes used to build post IDs and to recover dates from post URLs
+POST_ID_INVALID_REGEX = re.compile(r'[^a-z0-9\s-]')
+POST_ID_SEPARATOR_REGEX = re.compile(r'[\s-]+')
+URL_DATE_REGEX = re.compile(r'/(\d{4})/(\d{2})/(\d{2})/')
+
+# Child element lookups for RSS items, precompiled as XPath when lxml is available
+DC_NAMESPACE = "http://purl.org/dc/elements/1.1/"
+if HAS_LXML:
+    find_titles = ET.XPath('./title')
+    find_links = ET.XPath('./link')
+    find_pub_dates = ET.XPath('./pubDate')
+    find_creators = ET.XPath('./dc:creator', namespaces={'dc': DC_NAMESPACE})
+    find_categories = ET.XPath('./category')
+else:
+    def find_titles(item):
+        return item.findall('title')
+
+    def find_links(item):
+        return item.findall('link')
+
+    def find_pub_dates(item):
+        return item.findall('pubDate')
+
+    def find_creators(item):
+        return item.findall(f'{{{DC_NAMESPACE}}}creator')
+
+    def find_categories(item):
+        return item.iterfind('category')
+
+
+def detect_xml_backend() -> str:
+    """Describe which XML parser implementation is in use."""
+    if HAS_LXML:
+        return "lxml"
+    try:
+        import _elementtree
+        if ET.Element is _elementtree.Element:
+            return "ElementTree (C accelerator)"
+    except ImportError:
+        pass
+    return "ElementTree (pure Python)"
+
 
 def create_post_id(title: str) -> str:
     """Create a URL-friendly ID from a post title."""
-    post_id = title.lower()
-    post_id = re.sub(r'[^a-z0-9\s-]', '', post_id)
-    post_id = re.sub(r'[\s-]+', '-', post_id)
-    post_id = post_id[:50].strip('-')
-    return post_id
+    # Two compiled regex passes measured faster than str.translate() or a
+    # per-character filter on real titles, so the ID is built in two steps
+    post_id = POST_ID_INVALID_REGEX.sub('', title.lower())
+    post_id = POST_ID_SEPARATOR_REGEX.sub('-', post_id)
+    return post_id[:50].strip('-')
 
 
 def parse_rss_date(date_str: str) -> Optional[datetime]:
     """Parse RSS date formats."""
-    date_formats = [
-        "%a, %d %b %Y %H:%M:%S %z",
-        "%a, %d %b %Y %H:%M:%S %Z",
-        "%Y-%m-%dT%H:%M:%S%z",
-        "%Y-%m-%d",
-    ]
-
     date_str = date_str.strip()
 
-    for fmt in date_formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.replace(tzinfo=None)
-        except ValueError:
-            continue
+    # RFC 822 dates, as used by RSS pubDate
+    try:
+        return parsedate_to_datetime(date_str).replace(tzinfo=None)
+    except (TypeError, ValueError):
+        pass
 
-    return None
+    # ISO 8601 dates (strip "Z", which fromisoformat rejects before Python 3.11)
+    try:
+        return datetime.fromisoformat(date_str.rstrip('Z')).replace(tzinfo=None)
+    except ValueError:
+        pass
 
+    # ISO 8601 with a "+HHMM" offset, which fromisoformat rejects before Python 3.11
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%S%z").replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def parse_curl_output(output: bytes) -> tuple[int, dict[str, str], bytes]:
+    """Split curl -D - output into final status code, headers and body."""
+    status, headers = 0, {}
+    # With -L, curl writes one header block per response in the redirect chain
+    while output.startswith(b"HTTP/"):
+        block, _, output = output.partition(b"\r\n\r\n")
+        lines = block.decode("latin-1").split("\r\n")
+        status = int(lines[0].split()[1])
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+    return status, headers, output
+
+
+def request_with_curl(url: str, headers: Optional[dict[str, str]] = None) -> Optional[tuple[int, dict[str, str], bytes]]:
+    """Fetch URL using system curl, returning status code, headers and body."""
+    command = ["curl", "-Ls", "-D", "-", "-H", "Accept-Encoding: identity"]
+    for name, value in (headers or {}).items():
+        command += ["-H", f"{name}: {value}"]
+    command.append(url)
 
-def fetch_with_curl(url: str) -> Optional[str]:
-    """Try to fetch URL using system curl command (primary method)."""
     try:
-        result = subprocess.run(
-            [
-                "curl", "-Ls",
-                "-H", "Accept-Encoding: identity",
-                url
-            ],
-            capture_output=True,
-            timeout=30
-        )
+        result = subprocess.run(command, capture_output=True, timeout=30)
         if result.returncode == 0 and result.stdout:
-            return result.stdout.decode("utf-8", errors="ignore")
+            status, response_headers, body = parse_curl_output(result.stdout)
+            return status, response_headers, body
     except (subprocess.TimeoutExpired, FileNotFoundError):
         pass
     return None
 
 
-def fetch_with_urllib(url: str) -> Optional[str]:
-    """Try to fetch URL using urllib (fallback method)."""
+def request_with_urllib(url: str, headers: Optional[dict[str, str]] = None) -> Optional[tuple[int, dict[str, str], bytes]]:
+    """Fetch URL using urllib, returning status code, headers and body."""
     try:
-        req = Request(url, headers=HEADERS)
+        req = Request(url, headers={**HEADERS, **(headers or {})})
         with urlopen(req, timeout=30) as response:
-            return response.read().decode("utf-8", errors="ignore")
-    except (HTTPError, URLError, TimeoutError):
+            response_headers = {k.lower(): v for k, v in response.headers.items()}
+            return response.status, response_headers, response.read()
+    except HTTPError as e:
+        # urllib raises for 304 Not Modified as well as for real errors
+        return e.code, {k.lower(): v for k, v in e.headers.items()}, b""
+    except (URLError, TimeoutError, HTTPException, ConnectionError):
+        # HTTPException covers bodies cut short (IncompleteRead)
         pass
     return None
 
 
-def fetch_url(url: str) -> Optional[str]:
-    """Fetch URL content using curl (primary) or urllib (fallback)."""
-    content = fetch_with_curl(url)
-    if content:
-        return content
-    return fetch_with_urllib(url)
+def fetch_with_urllib(url: str) -> Optional[bytes]:
+    """Try to fetch URL using urllib (fallback method)."""
+    response = request_with_urllib(url)
+    if response and response[0] < 400:
+        return response[2]
+    return None
 
 
-def fetch_views(url: str) -> int:
-    """Fetch view count from a blog post page."""
-    import html as html_module
+def fetch_many_with_curl(urls: list[str]) -> list[Optional[bytes]]:
+    """Fetch several URLs with a single curl process so connections are reused."""
+    if not urls:
+        return []
 
-    content = fetch_url(url)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_paths = [Path(tmp_dir) / str(i) for i in range(len(urls))]
+        # Pass url/output pairs on argv rather than in a -K config file, so
+        # neither value goes through curl's config quoting and escaping
+        transfers = []
+        for url, path in zip(urls, output_paths):
+            transfers += ["--url", url, "-o", str(path)]
+        try:
+            result = subprocess.run(
+                [
+                    "curl", "-Ls", "--globoff",
+                    "--parallel", "--parallel-max", str(MAX_CONCURRENT_REQUESTS),
+                    "--max-time", "30",
+                    "-H", "Accept-Encoding: identity",
+                    # One "<index> <exit code>" line per transfer, in completion order
+                    "-w", "%{urlnum} %{exitcode}\n",
+                    *transfers,
+                ],
+                capture_output=True,
+                timeout=30 * len(urls)
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return [None] * len(urls)
+
+        # Only transfers that completed cleanly count; a truncated body is a failure
+        succeeded = set()
+        for line in result.stdout.decode("ascii", errors="ignore").splitlines():
+            index, _, exit_code = line.partition(" ")
+            if index.isdigit() and exit_code == "0":
+                succeeded.add(int(index))
+
+        contents = []
+        for i, path in enumerate(output_paths):
+            content = path.read_bytes() if i in succeeded and path.exists() else b""
+            contents.append(content or None)
+        return contents
+
+
+def parse_views(content: Optional[bytes]) -> Optional[int]:
+    """Extract the view count from blog post page HTML, or None if not found."""
     if not content:
-        return 0
+        return None
 
-    # Normalize whitespace and HTML entities
-    content = content.replace("\xa0", " ")
-    content = html_module.unescape(content)
+    # Resolve HTML entities; the \xa0 left behind by &nbsp; is matched by \s in VIEW_REGEX
+    content = html.unescape(content.decode("utf-8", errors="ignore"))
 
     # Extract view count
     match = VIEW_REGEX.search(content)
     if match:
         return int(match.group(1).replace(",", ""))
 
-    return 0
+    return None
+
+
+def fetch_all_views(posts: list[dict]) -> list[Optional[int]]:
+    """Fetch view counts for all posts concurrently (None where the fetch failed)."""
+    urls = [post['url'] for post in posts]
+    contents = fetch_many_with_curl(urls)
+
+    # Retry pages curl could not fetch with urllib, in parallel threads
+    missing = [url for url, content in zip(urls, contents) if not content]
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        fallback = dict(zip(missing, executor.map(fetch_with_urllib, missing)))
+
+    return [parse_views(content or fallback.get(url)) for url, content in zip(urls, contents)]
+
 
+def load_rss_cache() -> dict:
+    """Load the RSS cache index (cache validators and body file per feed URL)."""
+    if RSS_CACHE_INDEX.exists():
+        try:
+            with open(RSS_CACHE_INDEX, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, IOError):
+            pass
+    return {}
+
+
+def save_rss_cache(cache: dict) -> None:
+    """Write the RSS cache index to disk (best effort, like the feed bodies)."""
+    try:
+        RSS_CACHE_DIR.mkdir(exist_ok=True)
+        with open(RSS_CACHE_INDEX, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except IOError as e:
+        print(f"  Warning: Could not write RSS cache: {e}")
+
+
+def read_cached_feed(url: str, cache: dict) -> Optional[bytes]:
+    """Return the cached body of an RSS feed, if any."""
+    entry = cache.get(url)
+    if not entry:
+        return None
+    body_path = RSS_CACHE_DIR / entry['body_path']
+    try:
+        return body_path.read_bytes()
+    except IOError:
+        return None
+
+
+def write_cached_feed(url: str, cache: dict, headers: dict[str, str], content: bytes) -> None:
+    """Store an RSS feed body along with its ETag/Last-Modified validators."""
+    body_path = f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.xml"
+    try:
+        RSS_CACHE_DIR.mkdir(exist_ok=True)
+        (RSS_CACHE_DIR / body_path).write_bytes(content)
+    except IOError:
+        return
+    cache[url] = {
+        "etag": headers.get('etag'),
+        "last_modified": headers.get('last-modified'),
+        "body_path": body_path,
+    }
 
-def fetch_rss_feed(url: str) -> Optional[str]:
-    """Fetch RSS feed content using multiple methods."""
-    # Try curl first (works better with Akamai)
-    content = fetch_with_curl(url)
-    if content and "<?xml" in content:
-        return content
 
-    # Try urllib as fallback
-    content = fetch_with_urllib(url)
-    if content and "<?xml" in content:
-        return content
+def looks_like_xml(content: bytes) -> bool:
+    """Check for an XML declaration at the start of the content."""
+    # Only inspect the prefix: CDN block pages can be large HTML documents
+    return content[:256].removeprefix(codecs.BOM_UTF8).lstrip().startswith(b"<?xml")
+
+
+def is_cdn_block(status: int, content: bytes) -> bool:
+    """Check whether a response is an Akamai bot-protection block."""
+    return status == 403 or CDN_BLOCK_MARKER in content[:1024]
+
+
+def fetch_rss_feed(url: str, cache: dict, use_cache: bool = False, save_cache: bool = True) -> Optional[bytes]:
+    """Fetch RSS feed content using multiple methods, revalidating any cached copy."""
+    cached = read_cached_feed(url, cache)
+    if cached and use_cache:
+        return cached
+
+    # Conditional GET: the server answers 304 Not Modified if the feed is unchanged
+    request_headers = {}
+    if cached:
+        entry = cache[url]
+        if entry.get('etag'):
+            request_headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            request_headers['If-Modified-Since'] = entry['last_modified']
+
+    # Try curl first (works better with Akamai), then urllib as fallback
+    for request in (request_with_curl, request_with_urllib):
+        response = request(url, request_headers)
+        if not response:
+            continue
+
+        status, headers, content = response
+        if status == 304 and cached:
+            return cached
+        if content and looks_like_xml(content):
+            if save_cache:
+                write_cached_feed(url, cache, headers, content)
+            return content
+        if is_cdn_block(status, content):
+            # urllib from the same IP would get the same block page
+            break
 
     return None
 
 
-def parse_rss_feed(xml_content: str) -> list[dict]:
+def fetch_rss_feeds(urls: list[str], cache: dict, use_cache: bool = False, save_cache: bool = True) -> list[Optional[bytes]]:
+    """Fetch all RSS feeds concurrently."""
+    with ThreadPoolExecutor(max_workers=max(len(urls), 1)) as executor:
+        return list(executor.map(fetch_rss_feed, urls, repeat(cache), repeat(use_cache), repeat(save_cache)))
+
+
+def first_element(elements: list) -> Optional[ET.Element]:
+    """Return the first element of a lookup result, or None if empty."""
+    return elements[0] if elements else None
+
+
+def parse_rss_item(item: ET.Element) -> Optional[dict]:
+    """Extract post data from an RSS item, or None if it should be skipped."""
+    title_elem = first_element(find_titles(item))
+    link_elem = first_element(find_links(item))
+    pub_date_elem = first_element(find_pub_dates(item))
+    creator_elem = first_element(find_creators(item))
+
+    if title_elem is None or link_elem is None:
+        return None
+
+    title = title_elem.text or ""
+    url = link_elem.text or ""
+
+    author = ""
+    if creator_elem is not None and creator_elem.text:
+        author = creator_elem.text
+
+    if AUTHOR_NAME.lower() not in author.lower():
+        return None
+
+    pub_date = None
+    if pub_date_elem is not None and pub_date_elem.text:
+        pub_date = parse_rss_date(pub_date_elem.text)
+
+    if not pub_date:
+        date_match = URL_DATE_REGEX.search(url)
+        if date_match:
+            pub_date = datetime(
+                int(date_match.group(1)),
+                int(date_match.group(2)),
+                int(date_match.group(3))
+            )
+
+    if not pub_date or pub_date < START_DATE:
+        return None
+
+    categories = [text for cat_elem in find_categories(item) if (text := cat_elem.text)]
+
+    return {
+        "id": create_post_id(title),
+        "title": title,
+        "date": f"{pub_date.year:04d}-{pub_date.month:02d}-{pub_date.day:02d}",
+        "url": url,
+        "categories": categories,
+        "views": 0,
+    }
+
+
+def parse_rss_feed(xml_content: bytes) -> list[dict]:
     """Parse RSS feed XML and extract post data."""
     posts = []
 
     try:
-        root = ET.fromstring(xml_content)
-        items = root.findall('.//item')
+        # Stream the feed and release each item once processed
+        context = ET.iterparse(io.BytesIO(xml_content), events=('end',))
+        for _event, elem in context:
+            if elem.tag != 'item':
+                continue
 
-        for item in items:
             try:
-                title_elem = item.find('title')
-                link_elem = item.find('link')
-                pub_date_elem = item.find('pubDate')
-                creator_elem = item.find('.//{http://purl.org/dc/elements/1.1/}creator')
-
-                if title_elem is None or link_elem is None:
-                    continue
-
-                title = title_elem.text or ""
-                url = link_elem.text or ""
-
-                author = ""
-                if creator_elem is not None and creator_elem.text:
-                    author = creator_elem.text
-
-                if AUTHOR_NAME.lower() not in author.lower():
-                    continue
-
-                pub_date = None
-                if pub_date_elem is not None and pub_date_elem.text:
-                    pub_date = parse_rss_date(pub_date_elem.text)
-
-                if not pub_date:
-                    date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-                    if date_match:
-                        pub_date = datetime(
-                            int(date_match.group(1)),
-                            int(date_match.group(2)),
-                            int(date_match.group(3))
-                        )
-
-                if not pub_date or pub_date < START_DATE:
-                    continue
-
-                categories = []
-                for cat_elem in item.findall('category'):
-                    if cat_elem.text:
-                        categories.append(cat_elem.text)
-
-                post = {
-                    "id": create_post_id(title),
-                    "title": title,
-                    "date": pub_date.strftime("%Y-%m-%d"),
-                    "url": url,
-                    "categories": categories,
-                    "views": 0,
-                }
-
-                posts.append(post)
-
+                post = parse_rss_item(elem)
+                if post:
+                    posts.append(post)
             except Exception as e:
                 print(f"  Warning: Error parsing item: {e}")
-                continue
+            finally:
+                elem.clear()
+
+        context.root.clear()
 
     except ET.ParseError as e:
         print(f"  Warning: XML parse error: {e}")
@@ -236,16 +477,20 @@ def parse_rss_feed(xml_content: str) -> list[dict]:
     return posts
 
 
-def scrape_all_posts(use_cache: bool = False) -> list[dict]:
+def scrape_all_posts(use_cache: bool = False, save_cache: bool = True) -> list[dict]:
     """Scrape all posts from RSS feeds."""
     all_posts = {}
     feeds_fetched = 0
 
     print(f"\nScraping posts by {AUTHOR_NAME} since {START_DATE.strftime('%Y-%m-%d')}...\n")
 
-    for feed_url in RSS_FEEDS:
-        print(f"Fetching: {feed_url}")
-        xml_content = fetch_rss_feed(feed_url)
+    cache = load_rss_cache()
+    feeds = fetch_rss_feeds(RSS_FEEDS, cache, use_cache, save_cache)
+    if save_cache:
+        save_rss_cache(cache)
+
+    for feed_url, xml_content in zip(RSS_FEEDS, feeds):
+        print(f"Feed: {feed_url}")
 
         if not xml_content:
             print(f"  Failed to fetch (403/blocked)")
@@ -291,23 +536,34 @@ def load_existing_data() -> dict:
     if OUTPUT_FILE.exists():
         try:
             with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                data = json.load(f)
         except (json.JSONDecodeError, IOError):
             pass
+        else:
+            # Keep viewsHistory in date order so the latest entry is always last
+            for post in data.get('posts', []):
+                post.get('viewsHistory', []).sort(key=lambda h: h['date'])
+            return data
     return {"lastUpdated": "", "posts": []}
 
 
-def merge_posts(new_posts: list[dict], existing_data: dict) -> list[dict]:
-    """Merge new posts with existing data, preserving view counts."""
-    existing_by_url = {p['url']: p for p in existing_data.get('posts', [])}
+def save_output(output: dict) -> None:
+    """Write posts data to OUTPUT_FILE as indented JSON."""
+    if HAS_ORJSON:
+        # Same layout as json.dump(indent=2, ensure_ascii=False), encoded directly to UTF-8
+        OUTPUT_FILE.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
 
+
+def merge_posts(new_posts: list[dict], existing_by_url: dict[str, dict]) -> list[dict]:
+    """Merge new posts with existing data, preserving view counts and history."""
     merged = []
     for post in new_posts:
-        if post['url'] in existing_by_url:
-            existing = existing_by_url[post['url']]
-            post['views'] = existing.get('views', 0)
-            if 'viewsHistory' in existing:
-                post['viewsHistory'] = existing['viewsHistory']
+        existing = existing_by_url.get(post['url'], {})
+        post['views'] = existing.get('views', 0)
+        post['viewsHistory'] = existing.get('viewsHistory', [])
         merged.append(post)
 
     return merged
@@ -317,7 +573,7 @@ def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Scrape MATLAB AI Blog posts")
     parser.add_argument('--use-cache', action='store_true',
-                        help='Use cached RSS data if available')
+                        help='Use cached RSS feeds without revalidating them')
     parser.add_argument('--dry-run', action='store_true',
                         help='Print results without writing to file')
     args = parser.parse_args()
@@ -330,8 +586,13 @@ def main():
     if os.environ.get('CI') or os.environ.get('GITHUB_ACTIONS'):
         print("Running in CI environment")
 
+    xml_backend = detect_xml_backend()
+    print(f"XML parser: {xml_backend}")
+    if xml_backend == "ElementTree (pure Python)":
+        print("  Warning: C XML accelerator unavailable, RSS parsing will be slow (install lxml)")
+
     # Scrape posts
-    posts = scrape_all_posts(use_cache=args.use_cache)
+    posts = scrape_all_posts(use_cache=args.use_cache, save_cache=not args.dry_run)
 
     if not posts:
         print("\nNo posts found.")
@@ -344,37 +605,36 @@ def main():
     # Get today's date for history entry
     today = datetime.now().strftime("%Y-%m-%d")
 
-    # Fetch view counts for each post
-    print(f"\nFetching view counts for {len(posts)} posts...")
-    for i, post in enumerate(posts, 1):
-        print(f"  [{i}/{len(posts)}] {post['title'][:40]}...", end=" ")
-        views = fetch_views(post['url'])
-        post['views'] = views
-        print(f"{views:,} views")
-
-        # Preserve existing viewsHistory and append today's entry
-        if post['url'] in existing_by_url:
-            existing = existing_by_url[post['url']]
-            post['viewsHistory'] = existing.get('viewsHistory', [])
-        else:
-            post['viewsHistory'] = []
+    # Preserve existing views and viewsHistory; posts already recorded today
+    # keep their stored view count instead of fetching the page again
+    posts = merge_posts(posts, existing_by_url)
+    posts_to_fetch = [
+        post for post in posts
+        if not post['viewsHistory'] or post['viewsHistory'][-1]['date'] != today
+    ]
 
-        # Check if we already have an entry for today
-        today_entry_exists = any(h['date'] == today for h in post['viewsHistory'])
-        if not today_entry_exists:
-            post['viewsHistory'].append({"date": today, "views": views})
+    # Fetch view counts for the remaining posts
+    print(f"\nFetching view counts for {len(posts_to_fetch)} of {len(posts)} posts...")
+    all_views = fetch_all_views(posts_to_fetch)
+    for i, (post, views) in enumerate(zip(posts_to_fetch, all_views), 1):
+        if views is None:
+            # Keep the stored count and leave today unrecorded so the next run retries
+            print(f"  [{i}/{len(posts_to_fetch)}] {post['title'][:40]}... failed (keeping {post['views']:,} views)")
+            continue
+        post['views'] = views
+        post['viewsHistory'].append({"date": today, "views": views})
+        print(f"  [{i}/{len(posts_to_fetch)}] {post['title'][:40]}... {views:,} views")
 
     # Create output data
     output = {
-        "lastUpdated": datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "lastUpdated": datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
         "posts": posts
     }
 
     if args.dry_run:
         print("\n[DRY RUN - not writing to file]")
     else:
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        save_output(output)
 
     print("\n" + "=" * 60)
     print(f"Found {len(posts)} posts by {AUTHOR_NAME}")